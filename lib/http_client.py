@@ -0,0 +1,12 @@
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+
+# --- Axelarscan HTTP Session -------------------------------------------------------------------------------------
+# --- One keep-alive pool per server process, so moving between pages reuses open connections to api.axelarscan.io
+@st.cache_resource
+def get_http_session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
@@ -1,8 +1,13 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
-import time
+import orjson
+import ast
+from concurrent.futures import ThreadPoolExecutor
 import plotly.express as px
+from lib.sidebar import render_sidebar_footer
+from lib.http_client import get_http_session
 
 # --- Page Config ------------------------------------------------------------------------------------------------------
 st.set_page_config(
@@ -15,104 +20,89 @@ st.title("✨ITS Tokens")
 st.info("📊Charts initially display data for a default time range. Select a custom range to view results for your desired period.")
 
 # --- Sidebar Footer Slightly Left-Aligned ---
-st.sidebar.markdown(
-    """
-    <style>
-    .sidebar-footer {
-        position: fixed;
-        bottom: 20px;
-        width: 250px;
-        font-size: 13px;
-        color: gray;
-        margin-left: 5px; # -- MOVE LEFT
-        text-align: left;  
-    }
-    .sidebar-footer img {
-        width: 16px;
-        height: 16px;
-        vertical-align: middle;
-        border-radius: 50%;
-        margin-right: 5px;
-    }
-    .sidebar-footer a {
-        color: gray;
-        text-decoration: none;
-    }
-    </style>
-
-    <div class="sidebar-footer">
-        <div>
-            <a href="https://x.com/axelar" target="_blank">
-                <img src="https://img.cryptorank.io/coins/axelar1663924228506.png" alt="Axelar Logo">
-                Powered by Axelar
-            </a>
-        </div>
-        <div style="margin-top: 5px;">
-            <a href="https://x.com/0xeman_raz" target="_blank">
-                <img src="https://pbs.twimg.com/profile_images/1841479747332608000/bindDGZQ_400x400.jpg" alt="Eman Raz">
-                Built by Eman Raz
-            </a>
-        </div>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+render_sidebar_footer()
 
 # --- Convert date to unix (sec) ----------------------------------------------------------------------------------
 def to_unix_timestamp(dt):
-    return int(time.mktime(dt.timetuple()))
+    return int(pd.Timestamp(dt).tz_localize("UTC").timestamp())
 
 # --- Getting APIs -----------------------------------------------------------------------------------------
-@st.cache_data
-def load_data(start_date, end_date):
-    from_time = to_unix_timestamp(pd.to_datetime(start_date))
-    to_time = to_unix_timestamp(pd.to_datetime(end_date))
+# --- Some assets return their addresses as a JSON-encoded (or Python-literal) string instead of a list
+def parse_addresses(addresses):
+    if not isinstance(addresses, str):
+        return addresses or []
+    try:
+        return orjson.loads(addresses)
+    except ValueError:
+        try:
+            return ast.literal_eval(addresses)
+        except (ValueError, SyntaxError):
+            return []
+
+# --- The ITS asset list rarely changes and does not depend on the dates, so it is cached for a day on its own
+@st.cache_data(ttl=86400, show_spinner=False)
+def load_its_assets():
+    url_assets = "https://api.axelarscan.io/api/getITSAssets"
+    assets_data = orjson.loads(get_http_session().get(url_assets, timeout=15).content)
 
-    url_tx = f"https://api.axelarscan.io/gmp/GMPTopITSAssets?fromTime={from_time}&toTime={to_time}"
-    tx_data = requests.get(url_tx).json().get("data", [])
+    assets = pd.DataFrame(assets_data, columns=["symbol", "image", "addresses"])
+    assets[["symbol", "image"]] = assets[["symbol", "image"]].fillna("")
+    symbol_to_image = dict(zip(assets["symbol"], assets["image"]))
 
-    url_assets = "https://api.axelarscan.io/api/getITSAssets"
-    assets_data = requests.get(url_assets).json()
-
-    address_to_symbol = {}
-    symbol_to_image = {}
-    for asset in assets_data:
-        symbol = asset.get("symbol", "")
-        image = asset.get("image", "")
-        symbol_to_image[symbol] = image
-        addresses = asset.get("addresses", [])
-        if isinstance(addresses, str):
-            try:
-                addresses = eval(addresses)
-            except:
-                addresses = []
-        for addr in addresses:
-            address_to_symbol[addr.lower()] = symbol
-
-    df = pd.DataFrame(tx_data)
-    if df.empty:
-        return pd.DataFrame(columns=["Token Address", "Symbol", "Logo", "Number of Transfers", "Volume of Transfers"]), {}
+    # --- One row per (symbol, address); later assets win on duplicate addresses, as with the former loop
+    asset_addresses = (assets[["symbol"]].assign(address=assets["addresses"].map(parse_addresses))
+                       .explode("address").dropna(subset=["address"]))
+    address_to_symbol = dict(zip(asset_addresses["address"].str.lower(), asset_addresses["symbol"]))
 
-    df["Token Address"] = df["key"]
-    df["Symbol"] = df["key"].str.lower().map(address_to_symbol).fillna("Unknown")
-    df["Logo"] = df["Symbol"].map(symbol_to_image).fillna("")
-    df["Number of Transfers"] = df["num_txs"].astype(int)
-    df["Volume of Transfers"] = df["volume"].astype(float)
+    return address_to_symbol, symbol_to_image
 
-    df = df[["Token Address", "Symbol", "Logo", "Number of Transfers", "Volume of Transfers"]]
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_data(from_time: int, to_time: int):
+    url_tx = f"https://api.axelarscan.io/gmp/GMPTopITSAssets?fromTime={from_time}&toTime={to_time}"
+    # --- The transfer request and the asset list download overlap instead of running back to back
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tx_future = executor.submit(get_http_session().get, url_tx, timeout=15)
+        assets_future = executor.submit(load_its_assets)
+    tx_data = orjson.loads(tx_future.result().content).get("data", [])
+    address_to_symbol, symbol_to_image = assets_future.result()
+
+    if not tx_data:
+        return pd.DataFrame(columns=["Token Address", "Symbol", "Logo", "Number of Transfers", "Volume of Transfers"]), {}
+
+    # --- Build the output columns straight from the records instead of copying a full frame of every API field
+    df = pd.DataFrame({
+        "Token Address": [d["key"] for d in tx_data],
+        "Number of Transfers": np.fromiter((d.get("num_txs", 0) for d in tx_data), dtype=np.int64, count=len(tx_data)),
+        "Volume of Transfers": np.fromiter((d.get("volume", 0.0) for d in tx_data), dtype=np.float64, count=len(tx_data))
+    })
+    df.insert(1, "Symbol", df["Token Address"].str.lower().map(address_to_symbol).fillna("Unknown"))
+    df.insert(2, "Logo", df["Symbol"].map(symbol_to_image).fillna(""))
+    # --- Smallest integer type that fits the counts, and symbols as a category; volumes stay float64 for exact USD totals
+    df["Number of Transfers"] = pd.to_numeric(df["Number of Transfers"], downcast="integer")
+    df["Symbol"] = df["Symbol"].astype("category")
 
     return df, symbol_to_image
 
 # --- Main Run ------------------------------------------------------------------------------------------------------
-st.set_page_config(page_title="Axelar Interchain Token Service", layout="wide")
-
 col1, col2 = st.columns(2)
 with col1:
     start_date = st.date_input("Start Date", value=pd.to_datetime("2023-12-01"))
 with col2:
     end_date = st.date_input("End Date", value=pd.to_datetime("2025-09-30"))
 
-df, symbol_to_image = load_data(start_date, end_date)
+if start_date > end_date:
+    st.error("⛔ Start date must be on or before the end date.")
+    st.stop()
+
+# --- Unix bounds are computed once per run and used as the load_data cache key
+from_time = to_unix_timestamp(pd.to_datetime(start_date))
+to_time = to_unix_timestamp(pd.to_datetime(end_date))
+
+try:
+    df, symbol_to_image = load_data(from_time, to_time)
+except requests.RequestException as e:
+    st.error(f"Failed to load API data: {e}")
+    st.stop()
 
 if df.empty:
     st.warning("⛔ No data available for the selected time range.")
@@ -142,7 +132,7 @@ else:
     # --- chart 1: Top 10 by Volume (without Unknown) -------------------------------------------------------------------
     df_grouped = (
         df[df["Symbol"] != "Unknown"]
-        .groupby("Symbol", as_index=False)
+        .groupby("Symbol", observed=True, as_index=False)
         .agg({
             "Number of Transfers": "sum",
             "Volume of Transfers": "sum"
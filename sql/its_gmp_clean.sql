@@ -0,0 +1,29 @@
+-- Cleaned, pre-filtered ITS transfers read by the Interchain Transfers page.
+-- Create it once, then set `its_gmp_table = "<database>.<schema>.its_gmp_clean"` under [snowflake] in secrets.toml.
+-- When its_gmp_table is unset, the page reads this SELECT from here and runs it inline.
+CREATE MATERIALIZED VIEW IF NOT EXISTS its_gmp_clean AS
+SELECT
+  created_at,
+  LOWER(data:call.chain::STRING) AS source_chain,
+  LOWER(data:call.returnValues.destinationChain::STRING) AS destination_chain,
+  data:call.transaction.from::STRING AS user,
+  COALESCE(
+    CASE
+      WHEN IS_ARRAY(data:gas:gas_used_amount) OR IS_OBJECT(data:gas:gas_used_amount)
+        OR IS_ARRAY(data:gas_price_rate:source_token.token_price.usd) OR IS_OBJECT(data:gas_price_rate:source_token.token_price.usd)
+      THEN NULL
+      ELSE TRY_TO_DOUBLE(data:gas:gas_used_amount::STRING) * TRY_TO_DOUBLE(data:gas_price_rate:source_token.token_price.usd::STRING)
+    END,
+    CASE
+      WHEN IS_ARRAY(data:fees:express_fee_usd) OR IS_OBJECT(data:fees:express_fee_usd) THEN NULL
+      ELSE TRY_TO_DOUBLE(data:fees:express_fee_usd::STRING)
+    END
+  ) AS fee,
+  data:symbol::STRING AS symbol
+FROM axelar.axelscan.fact_gmp
+WHERE status = 'executed'
+  AND simplified_status = 'received'
+  AND (
+    LOWER(data:approved:returnValues:contractAddress::STRING) = '0xb5fb4be02232b1bba4dc8f81dc24c26980de9e3c' -- Interchain Token Service
+    OR LOWER(data:approved:returnValues:contractAddress::STRING) = 'axelar1aqcj54lzz0rk22gvqgcn8fr5tx4rzwdv5wv5j9dmnacgefvd7wzsy2j2mr' -- Axelar ITS Hub
+  );
@@ -0,0 +1,44 @@
+-- Cleaned, pre-filtered ITS token deployments read by the Token Deployments page.
+-- Create it once, then set `its_deployments_table = "<database>.<schema>.its_token_deployments"` under [snowflake] in secrets.toml.
+
+-- The projection is defined once here; the initial build and the nightly task both copy it into the table.
+-- When its_deployments_table is unset, the page reads this SELECT from here and runs it inline.
+CREATE OR REPLACE VIEW its_token_deployments_clean AS
+SELECT
+  created_at,
+  data:interchain_token_deployment_started:tokenId::STRING AS token,
+  data:call:transaction:from::STRING AS deployer,
+  COALESCE(
+    CASE
+      WHEN IS_ARRAY(data:gas:gas_used_amount) OR IS_OBJECT(data:gas:gas_used_amount)
+        OR IS_ARRAY(data:gas_price_rate:source_token.token_price.usd) OR IS_OBJECT(data:gas_price_rate:source_token.token_price.usd)
+      THEN NULL
+      ELSE TRY_TO_DOUBLE(data:gas:gas_used_amount::STRING) * TRY_TO_DOUBLE(data:gas_price_rate:source_token.token_price.usd::STRING)
+    END,
+    CASE
+      WHEN IS_ARRAY(data:fees:express_fee_usd) OR IS_OBJECT(data:fees:express_fee_usd) THEN NULL
+      ELSE TRY_TO_DOUBLE(data:fees:express_fee_usd::STRING)
+    END
+  ) AS fee,
+  LOWER(data:call.chain::STRING) AS deployed_chain
+FROM axelar.axelscan.fact_gmp
+WHERE status = 'executed'
+  AND simplified_status = 'received'
+  AND (
+    LOWER(data:approved:returnValues:contractAddress::STRING) = '0xb5fb4be02232b1bba4dc8f81dc24c26980de9e3c' -- Interchain Token Service
+    OR LOWER(data:approved:returnValues:contractAddress::STRING) = 'axelar1aqcj54lzz0rk22gvqgcn8fr5tx4rzwdv5wv5j9dmnacgefvd7wzsy2j2mr' -- Axelar ITS Hub
+  )
+  AND data:interchain_token_deployment_started:event = 'InterchainTokenDeploymentStarted';
+
+CREATE OR REPLACE TRANSIENT TABLE its_token_deployments AS
+SELECT * FROM its_token_deployments_clean;
+
+-- Rebuild the table nightly; replace <warehouse> with the warehouse the dashboard uses.
+CREATE OR REPLACE TASK refresh_its_token_deployments
+  WAREHOUSE = <warehouse>
+  SCHEDULE = 'USING CRON 0 1 * * * UTC'
+AS
+  CREATE OR REPLACE TRANSIENT TABLE its_token_deployments AS
+  SELECT * FROM its_token_deployments_clean;
+
+ALTER TASK refresh_its_token_deployments RESUME;